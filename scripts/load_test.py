@@ -0,0 +1,701 @@
+"""Load-test harness for the Resume Ranking API.
+
+Starts the app locally behind uvicorn with a fake Google Gemini backend, drives
+`/extract-criteria`, `/rank-resumes` and `/score-resumes` with generated PDF and
+DOCX documents, and reports throughput, latency percentiles, error rate and
+peak server RSS per endpoint.
+
+Example:
+    python scripts/load_test.py --rate 20 --duration 30 --batch-sizes 1,5,10 \
+        --mix pdf=3,docx=1 --llm-latency-ms 800 --llm-error-rate 0.05 --slo-p95-ms 2000 --slo-degraded-rate 0.1
+"""
+import argparse
+import asyncio
+import contextvars
+import io
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import types
+import uuid
+import zipfile
+from typing import Dict, List, Optional, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Each endpoint is served by the module that actually defines it.
+ENDPOINT_MODULES = {
+    "/extract-criteria": "app.main1",
+    "/rank-resumes": "app.main",
+    "/score-resumes": "app.main1",
+}
+
+READY_PATH = "/__loadtest__/ready"
+
+# Response headers carrying the fake Gemini calls and injected failures behind each request.
+LLM_CALLS_HEADER = "x-loadtest-llm-calls"
+LLM_FAILURES_HEADER = "x-loadtest-llm-failures"
+
+CONTENT_TYPES = {
+    "pdf": "application/pdf",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+}
+
+CRITERIA = {
+    "skills": ["Python", "FastAPI", "SQL"],
+    "experience": ["5+ years of experience"],
+    "certifications": ["AWS Certified"],
+    "qualifications": ["Bachelor's degree"],
+}
+
+
+# **Fake Google Gemini Backend**
+class FakeResponse:
+    """Mimics the `text` attribute of a Gemini response."""
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+# Per-request counters, set by `LLMCountsMiddleware` and bumped by the fake model.
+LLM_COUNTS: contextvars.ContextVar = contextvars.ContextVar("llm_counts", default=None)
+
+
+class FakeGenerativeModel:
+    """Stand-in for `genai.GenerativeModel` with injected latency and errors."""
+
+    latency_ms = 0.0
+    jitter_ms = 0.0
+    error_rate = 0.0
+
+    def __init__(self, model_name: str, *args, **kwargs):
+        self.model_name = model_name
+
+    def generate_content(self, prompt: str, *args, **kwargs) -> FakeResponse:
+        # The real SDK call is blocking, so the fake blocks too.
+        time.sleep(self._delay())
+        return self._respond(prompt)
+
+    async def generate_content_async(self, prompt: str, *args, **kwargs) -> FakeResponse:
+        await asyncio.sleep(self._delay())
+        return self._respond(prompt)
+
+    def _delay(self) -> float:
+        return max(self.latency_ms + random.uniform(-self.jitter_ms, self.jitter_ms), 0.0) / 1000
+
+    def _respond(self, prompt: str) -> FakeResponse:
+        counts = LLM_COUNTS.get()
+        failed = random.random() < self.error_rate
+        if counts is not None:
+            counts["calls"] += 1
+            counts["failures"] += failed
+        if failed:
+            raise RuntimeError("Injected Gemini failure")
+
+        if "Resume Content:" in prompt:
+            return FakeResponse(json.dumps({
+                "skills": CRITERIA["skills"],
+                "experience": "5",
+                "certifications": CRITERIA["certifications"],
+                "qualifications": CRITERIA["qualifications"],
+            }))
+        if "_score" in prompt:
+            # Empty details mean the app's resume extraction call failed; score that as
+            # zero so the fallback stays visible in the response for `is_degraded`.
+            if "Skills: \n" in prompt:
+                return FakeResponse(json.dumps({
+                    "skills_score": 0, "experience_score": 0, "certifications_score": 0, "qualifications_score": 0,
+                }))
+            return FakeResponse(json.dumps({
+                "skills_score": random.randint(1, 5),
+                "experience_score": random.randint(1, 5),
+                "certifications_score": random.randint(1, 5),
+                "qualifications_score": random.randint(1, 5),
+            }))
+        return FakeResponse(json.dumps({"criteria": [c for values in CRITERIA.values() for c in values]}))
+
+
+def install_fake_gemini(latency_ms: float, jitter_ms: float, error_rate: float):
+    """Registers a fake `google.generativeai` module so the app never calls the real API."""
+    FakeGenerativeModel.latency_ms = latency_ms
+    FakeGenerativeModel.jitter_ms = jitter_ms
+    FakeGenerativeModel.error_rate = error_rate
+
+    genai = types.ModuleType("google.generativeai")
+    genai.configure = lambda *args, **kwargs: None
+    genai.GenerativeModel = FakeGenerativeModel
+
+    google = sys.modules.get("google")
+    if google is None:
+        google = types.ModuleType("google")
+        google.__path__ = []
+        sys.modules["google"] = google
+    google.generativeai = genai
+    sys.modules["google.generativeai"] = genai
+
+
+# **Local Server**
+class LLMCountsMiddleware:
+    """ASGI middleware reporting each request's fake Gemini calls and failures as response headers."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        counts = {"calls": 0, "failures": 0}
+        token = LLM_COUNTS.set(counts)
+
+        async def send_with_counts(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + [
+                    (LLM_CALLS_HEADER.encode(), str(counts["calls"]).encode()),
+                    (LLM_FAILURES_HEADER.encode(), str(counts["failures"]).encode()),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_counts)
+        finally:
+            LLM_COUNTS.reset(token)
+
+
+def serve(args):
+    """Runs the target app in this process with the fake Gemini backend installed."""
+    import importlib
+    import uvicorn
+
+    install_fake_gemini(args.llm_latency_ms, args.llm_jitter_ms, args.llm_error_rate)
+    app = importlib.import_module(args.module).app
+    app.add_middleware(LLMCountsMiddleware)
+
+    @app.get(READY_PATH, include_in_schema=False)
+    async def ready():
+        return {"ready": True}
+
+    uvicorn.run(app, host="127.0.0.1", port=args.port, log_level="warning", access_log=False)
+
+
+def free_port() -> int:
+    """Asks the OS for an unused local TCP port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(module: str, args, workdir: str) -> Tuple[subprocess.Popen, int]:
+    """Starts a fresh server for one endpoint so its peak RSS is measured in isolation."""
+    port = free_port()
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [REPO_ROOT, os.environ.get("PYTHONPATH")])))
+    cmd = [
+        sys.executable, os.path.abspath(__file__), "serve",
+        "--module", module,
+        "--port", str(port),
+        "--llm-latency-ms", str(args.llm_latency_ms),
+        "--llm-jitter-ms", str(args.llm_jitter_ms),
+        "--llm-error-rate", str(args.llm_error_rate),
+    ]
+    # The app writes resume_scores.csv to its working directory, so keep it out of the repo.
+    # Its per-request prints go to stdout, which is dropped to keep the report readable.
+    process = subprocess.Popen(cmd, cwd=workdir, env=env, stdout=subprocess.DEVNULL)
+    return process, port
+
+
+def stop_server(process: subprocess.Popen) -> Optional[float]:
+    """Stops the server and returns its peak RSS in MB, or None if it had already exited.
+
+    Peak RSS comes from the kernel's resource usage for the reaped child, so it is
+    available even when the server's event loop is too busy to answer requests.
+    """
+    if process.poll() is not None:
+        return None
+    process.terminate()
+    deadline = time.monotonic() + 10
+    pid, status, usage = os.wait4(process.pid, os.WNOHANG)
+    while not pid:
+        if time.monotonic() > deadline:
+            process.kill()
+            pid, status, usage = os.wait4(process.pid, 0)
+            break
+        time.sleep(0.05)
+        pid, status, usage = os.wait4(process.pid, os.WNOHANG)
+    process.returncode = os.waitstatus_to_exitcode(status)
+    # ru_maxrss is kilobytes on Linux and bytes on macOS.
+    return usage.ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+# **Test Documents**
+def _pdf_escape(line: str) -> str:
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_pdf(lines: List[str]) -> bytes:
+    """Builds a minimal single-font PDF, one page per 50 lines."""
+    pages = [lines[i:i + 50] for i in range(0, len(lines), 50)] or [[]]
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None, "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for page_lines in pages:
+        ops = ["BT", "/F1 11 Tf", "14 TL", "50 780 Td"] + [f"({_pdf_escape(line)}) '" for line in page_lines] + ["ET"]
+        stream = "\n".join(ops).encode("latin-1", "replace")
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream.decode('latin-1')}\nendstream")
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                       f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>")
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1"))
+    xref = out.tell()
+    out.write(f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("latin-1"))
+    for offset in offsets:
+        out.write(f"{offset:010d} 00000 n \n".encode("latin-1"))
+    out.write(f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode("latin-1"))
+    return out.getvalue()
+
+
+def make_docx(lines: List[str]) -> bytes:
+    """Builds a minimal DOCX with one paragraph per line."""
+    from xml.sax.saxutils import escape
+
+    paragraphs = "".join(f"<w:p><w:r><w:t>{escape(line)}</w:t></w:r></w:p>" for line in lines)
+    document = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+                f"<w:body>{paragraphs}</w:body></w:document>")
+    content_types = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                     '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+                     '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+                     '<Default Extension="xml" ContentType="application/xml"/>'
+                     '<Override PartName="/word/document.xml" '
+                     'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+                     "</Types>")
+    rels = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" '
+            'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+            'Target="word/document.xml"/></Relationships>')
+
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", content_types)
+        archive.writestr("_rels/.rels", rels)
+        archive.writestr("word/document.xml", document)
+    return out.getvalue()
+
+
+def make_document_lines(kind: str, n_lines: int) -> List[str]:
+    """Generates job-description or resume text that mentions the sample criteria."""
+    if kind == "jd":
+        lines = ["Job Description: Backend Engineer"]
+        filler = ["Required skill: {}", "Experience: {}", "Certification preferred: {}", "Qualification: {}"]
+    else:
+        lines = [f"Name: Candidate {random.choice(['Alice', 'Bob', 'Carol', 'Dave'])} Smith"]
+        filler = ["Skilled in {}", "Has {}", "Holds {}", "Earned a {}"]
+    values = list(CRITERIA.values())
+    while len(lines) < n_lines:
+        i = len(lines) % len(filler)
+        lines.append(filler[i].format(random.choice(values[i])))
+    return lines
+
+
+def build_document_pool(mix: Dict[str, float], n_lines: int, kind: str, size: int = 8) -> List[Tuple[str, str, bytes]]:
+    """Pre-builds documents as (filename, content type, bytes) so generation cost stays out of the timings."""
+    builders = {"pdf": make_pdf, "docx": make_docx}
+    pool = []
+    for fmt in mix:
+        for i in range(size):
+            data = builders[fmt](make_document_lines(kind, n_lines))
+            pool.append((f"{kind}-{i}.{fmt}", CONTENT_TYPES[fmt], data))
+    return pool
+
+
+def pick_document(pool: List[Tuple[str, str, bytes]], mix: Dict[str, float]) -> Tuple[str, str, bytes]:
+    fmt = random.choices(list(mix), weights=list(mix.values()))[0]
+    return random.choice([doc for doc in pool if doc[0].endswith("." + fmt)])
+
+
+# **HTTP Client**
+def encode_multipart(fields: List[Tuple[str, str]], files: List[Tuple[str, Tuple[str, str, bytes]]]) -> Tuple[bytes, str]:
+    """Encodes form fields and files as multipart/form-data."""
+    boundary = uuid.uuid4().hex
+    body = io.BytesIO()
+    for name, value in fields:
+        body.write(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode())
+    for name, (filename, content_type, data) in files:
+        body.write(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+                   f"Content-Type: {content_type}\r\n\r\n".encode())
+        body.write(data)
+        body.write(b"\r\n")
+    body.write(f"--{boundary}--\r\n".encode())
+    return body.getvalue(), f"multipart/form-data; boundary={boundary}"
+
+
+async def http_request(port: int, method: str, path: str, body: bytes = b"", content_type: Optional[str] = None,
+                       timeout: float = 60.0) -> Tuple[int, Dict[str, str], bytes]:
+    """Sends one HTTP/1.1 request on a fresh connection and returns (status, headers, body)."""
+    reader, writer = await asyncio.wait_for(asyncio.open_connection("127.0.0.1", port), timeout)
+    try:
+        headers = [f"{method} {path} HTTP/1.1", f"Host: 127.0.0.1:{port}", "Connection: close",
+                   f"Content-Length: {len(body)}"]
+        if content_type:
+            headers.append(f"Content-Type: {content_type}")
+        writer.write(("\r\n".join(headers) + "\r\n\r\n").encode() + body)
+        await writer.drain()
+        response = await asyncio.wait_for(reader.read(), timeout)
+    finally:
+        writer.close()
+    head, _, payload = response.partition(b"\r\n\r\n")
+    status_line, *header_lines = head.decode("latin-1").split("\r\n")
+    headers = {}
+    for line in header_lines:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return int(status_line.split(" ", 2)[1]), headers, payload
+
+
+def build_request(endpoint: str, jd_pool, resume_pool, mix: Dict[str, float], batch_sizes: List[int]):
+    """Returns (body, content type, batch size) for one request to `endpoint`."""
+    if endpoint == "/extract-criteria":
+        body, content_type = encode_multipart([], [("file", pick_document(jd_pool, mix))])
+        return body, content_type, 1
+
+    batch = random.choice(batch_sizes)
+    files = [("files", pick_document(resume_pool, mix)) for _ in range(batch)]
+    if endpoint == "/rank-resumes":
+        fields = [(name, value) for name, values in CRITERIA.items() for value in values]
+    else:
+        fields = [("criteria", value) for values in CRITERIA.values() for value in values]
+    body, content_type = encode_multipart(fields, files)
+    return body, content_type, batch
+
+
+def is_degraded(endpoint: str, payload: bytes) -> bool:
+    """Detects the fallback values the app returns with a 200 when a Gemini call fails.
+
+    Only used to cross-check the per-request failure headers: a disagreement means
+    the fake's prompt matching has drifted from the prompts in `app/main1.py`.
+    """
+    try:
+        data = json.loads(payload)
+    except ValueError:
+        return False
+    if endpoint == "/extract-criteria":
+        return data.get("criteria") == ["Failed to extract criteria"]
+    if endpoint == "/score-resumes":
+        # The fake backend scores 1-5 on success and 0 when the details call failed,
+        # and the app returns a zero total when the scoring call fails.
+        return any(score.get("Total Score") == 0 for score in data.get("scores", []))
+    return False
+
+
+# **Load Generation**
+async def wait_until_ready(port: int, process: subprocess.Popen, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited early with code {process.returncode}")
+        try:
+            status, _, _ = await http_request(port, "GET", READY_PATH, timeout=2)
+            if status == 200:
+                return
+        except OSError:
+            pass
+        await asyncio.sleep(0.1)
+    raise RuntimeError("Server did not become ready in time")
+
+
+async def run_endpoint(endpoint: str, port: int, args, jd_pool, resume_pool) -> dict:
+    """Drives one endpoint with Poisson arrivals at `args.rate` for `args.duration` seconds."""
+    samples = []
+    semaphore = asyncio.Semaphore(args.max_in_flight) if args.max_in_flight else None
+
+    async def one_request(scheduled: float):
+        # Latency runs from the scheduled arrival, so time spent queued behind
+        # --max-in-flight or a late arrival loop is not omitted.
+        body, content_type, batch = build_request(endpoint, jd_pool, resume_pool, args.mix, args.batch_sizes)
+        start = time.perf_counter()
+        try:
+            status, headers, payload = await http_request(port, "POST", endpoint, body, content_type,
+                                                          timeout=args.timeout)
+            key = str(status)
+        except (OSError, asyncio.TimeoutError, ValueError, IndexError) as e:
+            status, headers, payload, key = 0, {}, b"", type(e).__name__
+        end = time.perf_counter()
+        ok = 200 <= status < 300
+        samples.append({
+            "latency_ms": (end - scheduled) * 1000,
+            "queue_ms": max(start - scheduled, 0.0) * 1000,
+            "service_ms": (end - start) * 1000,
+            "status": key,
+            "ok": ok,
+            "documents": batch if ok else 0,
+            "llm_calls": int(headers.get(LLM_CALLS_HEADER, 0)),
+            "llm_failures": int(headers.get(LLM_FAILURES_HEADER, 0)),
+            "payload_degraded": ok and is_degraded(endpoint, payload),
+        })
+
+    async def limited_request(scheduled: float):
+        if semaphore is None:
+            return await one_request(scheduled)
+        async with semaphore:
+            await one_request(scheduled)
+
+    tasks = []
+    start = time.perf_counter()
+    next_arrival = start
+    while next_arrival - start < args.duration:
+        delay = next_arrival - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(limited_request(next_arrival)))
+        next_arrival += random.expovariate(args.rate)
+    await asyncio.gather(*tasks)
+    # Never shorter than the arrival window, so a server that keeps up reports rps == offered.
+    elapsed = max(time.perf_counter() - start, args.duration)
+    return summarize(endpoint, samples, args.duration, elapsed)
+
+
+def summarize(endpoint: str, samples: List[dict], duration: float, elapsed: float) -> dict:
+    """Aggregates per-request samples into the endpoint's report row."""
+    total = len(samples)
+    ok = [s for s in samples if s["ok"]]
+    # A request is degraded when a Gemini call behind it failed but the app still answered 2xx.
+    degraded = sum(1 for s in ok if s["llm_failures"])
+    latencies = [s["latency_ms"] for s in samples]
+    service_times = [s["service_ms"] for s in samples]
+    status_counts: Dict[str, int] = {}
+    for s in samples:
+        status_counts[s["status"]] = status_counts.get(s["status"], 0) + 1
+    return {
+        "endpoint": endpoint,
+        "requests": total,
+        "offered_rps": total / duration,
+        # Only successful responses count as throughput.
+        "throughput_rps": len(ok) / elapsed,
+        "documents_per_s": sum(s["documents"] for s in ok) / elapsed,
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "p99_ms": percentile(latencies, 99),
+        "max_ms": max(latencies, default=0.0),
+        "queue_p95_ms": percentile([s["queue_ms"] for s in samples], 95),
+        "service_p50_ms": percentile(service_times, 50),
+        "service_p95_ms": percentile(service_times, 95),
+        "service_p99_ms": percentile(service_times, 99),
+        "error_rate": (total - len(ok)) / total if total else 0.0,
+        "degraded_rate": degraded / total if total else 0.0,
+        "degraded_mismatches": sum(1 for s in ok if bool(s["llm_failures"]) != s["payload_degraded"]),
+        "llm_calls": sum(s["llm_calls"] for s in samples),
+        "llm_failures": sum(s["llm_failures"] for s in samples),
+        "status_counts": status_counts,
+        "peak_rss_mb": None,
+    }
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile; 0.0 for an empty sample."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(int(-(-pct * len(ordered) // 100)), 1)
+    return ordered[rank - 1]
+
+
+# **SLO Report**
+def check_slos(result: dict, args) -> List[str]:
+    """Returns a description of every SLO the endpoint result breaches."""
+    breaches = []
+    for key, limit in (("p95_ms", args.slo_p95_ms), ("p99_ms", args.slo_p99_ms),
+                       ("error_rate", args.slo_error_rate), ("degraded_rate", args.slo_degraded_rate),
+                       ("peak_rss_mb", args.slo_peak_rss_mb)):
+        if limit is None:
+            continue
+        if result[key] is None:
+            breaches.append(f"{key} unavailable")
+        elif result[key] > limit:
+            breaches.append(f"{key} {result[key]:.2f} > {limit}")
+    if args.slo_min_rps is not None and result["throughput_rps"] < args.slo_min_rps:
+        breaches.append(f"throughput_rps {result['throughput_rps']:.2f} < {args.slo_min_rps}")
+    return breaches
+
+
+def print_report(results: List[dict]):
+    header = f"{'endpoint':<20}{'reqs':>7}{'offered':>9}{'ok rps':>9}{'docs/s':>9}{'p50 ms':>10}{'p95 ms':>10}" \
+             f"{'p99 ms':>10}{'wait p95':>10}{'errors':>9}{'degraded':>10}{'llm calls':>11}{'llm fails':>11}" \
+             f"{'rss MB':>9}  slo"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        slo = "FAIL: " + "; ".join(r["slo_breaches"]) if r["slo_breaches"] else "ok"
+        rss = "n/a" if r["peak_rss_mb"] is None else f"{r['peak_rss_mb']:.1f}"
+        print(f"{r['endpoint']:<20}{r['requests']:>7}{r['offered_rps']:>9.2f}{r['throughput_rps']:>9.2f}"
+              f"{r['documents_per_s']:>9.2f}{r['p50_ms']:>10.1f}{r['p95_ms']:>10.1f}{r['p99_ms']:>10.1f}"
+              f"{r['queue_p95_ms']:>10.1f}{r['error_rate']:>9.1%}{r['degraded_rate']:>10.1%}"
+              f"{r['llm_calls']:>11}{r['llm_failures']:>11}{rss:>9}  {slo}")
+    for r in results:
+        if r["degraded_mismatches"]:
+            print(f"warning: {r['endpoint']}: {r['degraded_mismatches']} responses disagree between injected "
+                  "Gemini failures and the fallback values in the body; the fake's prompt matching may have "
+                  "drifted from app/main1.py", file=sys.stderr)
+
+
+async def run_load_test(args) -> List[dict]:
+    jd_pool = build_document_pool(args.mix, args.doc_lines, "jd")
+    resume_pool = build_document_pool(args.mix, args.doc_lines, "resume")
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for endpoint in args.endpoints:
+            process, port = start_server(ENDPOINT_MODULES[endpoint], args, workdir)
+            try:
+                await wait_until_ready(port, process)
+            except RuntimeError as e:
+                stop_server(process)
+                result = summarize(endpoint, [], args.duration, args.duration)
+                result["slo_breaches"] = [f"server did not start: {e}"]
+                results.append(result)
+                continue
+            try:
+                result = await run_endpoint(endpoint, port, args, jd_pool, resume_pool)
+            finally:
+                peak_rss_mb = stop_server(process)
+            result["peak_rss_mb"] = peak_rss_mb
+            result["slo_breaches"] = check_slos(result, args)
+            results.append(result)
+    return results
+
+
+# **Command Line**
+def parse_mix(value: str) -> Dict[str, float]:
+    """Parses a document mix such as `pdf=3,docx=1` into format weights."""
+    mix = {}
+    for part in value.split(","):
+        fmt, _, weight = part.partition("=")
+        fmt = fmt.strip().lower()
+        if fmt not in CONTENT_TYPES:
+            raise argparse.ArgumentTypeError(f"Unknown document format: {fmt}")
+        mix[fmt] = float(weight or 1)
+        if mix[fmt] < 0:
+            raise argparse.ArgumentTypeError(f"Document weight must not be negative: {part}")
+    if not any(mix.values()):
+        raise argparse.ArgumentTypeError("Document mix needs at least one positive weight")
+    return mix
+
+
+def parse_positive_int_list(value: str) -> List[int]:
+    """Parses a comma-separated list of positive integers such as `1,5,10`."""
+    values = [int(part) for part in value.split(",")]
+    if any(v <= 0 for v in values):
+        raise argparse.ArgumentTypeError(f"Values must be positive: {value}")
+    return values
+
+
+def parse_positive_float(value: str) -> float:
+    number = float(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"Must be positive: {value}")
+    return number
+
+
+def parse_non_negative_float(value: str) -> float:
+    number = float(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"Must not be negative: {value}")
+    return number
+
+
+def parse_positive_int(value: str) -> int:
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"Must be positive: {value}")
+    return number
+
+
+def parse_non_negative_int(value: str) -> int:
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"Must not be negative: {value}")
+    return number
+
+
+def parse_fraction(value: str) -> float:
+    number = float(value)
+    if not 0 <= number <= 1:
+        raise argparse.ArgumentTypeError(f"Must be between 0 and 1: {value}")
+    return number
+
+
+def parse_endpoints(value: str) -> List[str]:
+    endpoints = ["/" + part.strip().lstrip("/") for part in value.split(",")]
+    unknown = [e for e in endpoints if e not in ENDPOINT_MODULES]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"Unknown endpoints: {', '.join(unknown)}")
+    return endpoints
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Load-test the Resume Ranking API against a fake Gemini backend.")
+    sub = parser.add_subparsers(dest="command")
+
+    llm = argparse.ArgumentParser(add_help=False)
+    llm.add_argument("--llm-latency-ms", type=parse_non_negative_float, default=500.0, help="Mean fake Gemini latency per call.")
+    llm.add_argument("--llm-jitter-ms", type=parse_non_negative_float, default=100.0, help="Uniform +/- jitter on the fake latency.")
+    llm.add_argument("--llm-error-rate", type=parse_fraction, default=0.0, help="Fraction of fake Gemini calls that raise.")
+
+    run = sub.add_parser("run", parents=[llm], help="Run the load test (default).")
+    run.add_argument("--endpoints", type=parse_endpoints, default=list(ENDPOINT_MODULES),
+                     help="Comma-separated endpoints to drive.")
+    run.add_argument("--rate", type=parse_positive_float, default=5.0, help="Mean arrival rate in requests per second.")
+    run.add_argument("--duration", type=parse_positive_float, default=20.0, help="Seconds of load per endpoint.")
+    run.add_argument("--max-in-flight", type=parse_non_negative_int, default=0, help="Cap on concurrent requests (0 = open loop).")
+    run.add_argument("--batch-sizes", type=parse_positive_int_list, default=[1, 5],
+                     help="Resumes per ranking request, sampled uniformly.")
+    run.add_argument("--mix", type=parse_mix, default={"pdf": 1.0, "docx": 1.0},
+                     help="Document format weights, e.g. pdf=3,docx=1.")
+    run.add_argument("--doc-lines", type=parse_positive_int, default=40, help="Lines of text per generated document.")
+    run.add_argument("--timeout", type=parse_positive_float, default=60.0, help="Per-request timeout in seconds.")
+    run.add_argument("--seed", type=int, default=None, help="Random seed for reproducible runs.")
+    run.add_argument("--json", dest="json_path", default=None, help="Also write the results to this JSON file.")
+    run.add_argument("--slo-p95-ms", type=float, default=None)
+    run.add_argument("--slo-p99-ms", type=float, default=None)
+    run.add_argument("--slo-error-rate", type=float, default=None, help="Max fraction of non-2xx responses.")
+    run.add_argument("--slo-degraded-rate", type=float, default=None,
+                     help="Max fraction of 200 responses carrying a Gemini fallback.")
+    run.add_argument("--slo-min-rps", type=float, default=None, help="Min successful requests per second.")
+    run.add_argument("--slo-peak-rss-mb", type=float, default=None)
+
+    srv = sub.add_parser("serve", parents=[llm], help=argparse.SUPPRESS)
+    srv.add_argument("--module", required=True)
+    srv.add_argument("--port", type=int, required=True)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if not argv or argv[0] not in ("run", "serve", "-h", "--help"):
+        argv.insert(0, "run")
+    args = build_parser().parse_args(argv)
+
+    if args.command == "serve":
+        serve(args)
+        return 0
+
+    if args.seed is not None:
+        random.seed(args.seed)
+    results = asyncio.run(run_load_test(args))
+    print_report(results)
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+    return 1 if any(r["slo_breaches"] for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+import argparse
+import asyncio
+import io
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
+
+import load_test  # noqa: E402
+
+
+def sample(ok=True, llm_failures=0, payload_degraded=False, latency_ms=10.0, documents=1):
+    return {
+        "latency_ms": latency_ms,
+        "queue_ms": 0.0,
+        "service_ms": latency_ms,
+        "status": "200" if ok else "TimeoutError",
+        "ok": ok,
+        "documents": documents if ok else 0,
+        "llm_calls": 2,
+        "llm_failures": llm_failures,
+        "payload_degraded": payload_degraded,
+    }
+
+
+# **percentile**
+def test_percentile_empty_sample():
+    assert load_test.percentile([], 95) == 0.0
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    assert load_test.percentile(values, 50) == 50
+    assert load_test.percentile(values, 95) == 95
+    assert load_test.percentile(values, 99) == 99
+    assert load_test.percentile([3.0, 1.0, 2.0], 0) == 1.0
+    assert load_test.percentile([3.0, 1.0, 2.0], 100) == 3.0
+
+
+# **Argument Parsers**
+def test_parse_mix():
+    assert load_test.parse_mix("pdf=3,docx=1") == {"pdf": 3.0, "docx": 1.0}
+    assert load_test.parse_mix("PDF") == {"pdf": 1.0}
+
+
+@pytest.mark.parametrize("value", ["txt=1", "pdf=-1,docx=1", "pdf=0,docx=0"])
+def test_parse_mix_rejects_invalid(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        load_test.parse_mix(value)
+
+
+def test_parse_positive_int_list():
+    assert load_test.parse_positive_int_list("1,5,10") == [1, 5, 10]
+    with pytest.raises(argparse.ArgumentTypeError):
+        load_test.parse_positive_int_list("1,0")
+
+
+@pytest.mark.parametrize("argv", [["--rate", "0"], ["--duration", "-1"], ["--max-in-flight", "-1"],
+                                  ["--batch-sizes", "0"], ["--llm-error-rate", "1.5"]])
+def test_parser_rejects_invalid_numbers(argv):
+    with pytest.raises(SystemExit):
+        load_test.build_parser().parse_args(["run"] + argv)
+
+
+# **Degraded Detection & Summary**
+def test_is_degraded():
+    assert load_test.is_degraded("/extract-criteria", b'{"criteria": ["Failed to extract criteria"]}')
+    assert not load_test.is_degraded("/extract-criteria", b'{"criteria": ["Python"]}')
+    assert load_test.is_degraded("/score-resumes", b'{"scores": [{"Total Score": 12}, {"Total Score": 0}]}')
+    assert not load_test.is_degraded("/score-resumes", b'{"scores": [{"Total Score": 12}]}')
+    assert not load_test.is_degraded("/rank-resumes", b'{"scores": [{"Total Score": 0}]}')
+    assert not load_test.is_degraded("/score-resumes", b"not json")
+
+
+def test_summarize_counts_only_successes_as_throughput():
+    samples = [sample(), sample(ok=False), sample(ok=False), sample(llm_failures=1, payload_degraded=True)]
+    result = load_test.summarize("/score-resumes", samples, duration=2.0, elapsed=4.0)
+    assert result["offered_rps"] == 2.0
+    assert result["throughput_rps"] == 0.5
+    assert result["documents_per_s"] == 0.5
+    assert result["error_rate"] == 0.5
+    assert result["degraded_rate"] == 0.25
+    assert result["degraded_mismatches"] == 0
+    assert result["status_counts"] == {"200": 2, "TimeoutError": 2}
+
+
+def test_summarize_flags_degraded_mismatches():
+    samples = [sample(llm_failures=1), sample(payload_degraded=True)]
+    result = load_test.summarize("/score-resumes", samples, duration=1.0, elapsed=1.0)
+    assert result["degraded_mismatches"] == 2
+
+
+def test_summarize_without_samples():
+    result = load_test.summarize("/rank-resumes", [], duration=1.0, elapsed=1.0)
+    assert result["requests"] == 0
+    assert result["p95_ms"] == 0.0
+    assert result["peak_rss_mb"] is None
+
+
+def test_check_slos_treats_missing_rss_as_breach():
+    args = load_test.build_parser().parse_args(["run", "--slo-peak-rss-mb", "100", "--slo-min-rps", "1"])
+    result = load_test.summarize("/rank-resumes", [sample(ok=False)], duration=1.0, elapsed=1.0)
+    assert load_test.check_slos(result, args) == ["peak_rss_mb unavailable", "throughput_rps 0.00 < 1.0"]
+
+
+# **Fake Gemini Backend**
+@pytest.fixture
+def fake_model(monkeypatch):
+    monkeypatch.setattr(load_test.FakeGenerativeModel, "latency_ms", 0.0)
+    monkeypatch.setattr(load_test.FakeGenerativeModel, "jitter_ms", 0.0)
+    monkeypatch.setattr(load_test.FakeGenerativeModel, "error_rate", 0.0)
+    return load_test.FakeGenerativeModel("gemini-1.5-pro")
+
+
+def test_fake_model_sync_and_async_responses(fake_model):
+    criteria = json.loads(fake_model.generate_content("Job Description:\nPython").text)
+    assert "Python" in criteria["criteria"]
+    details = json.loads(asyncio.run(fake_model.generate_content_async("Resume Content:\nPython")).text)
+    assert details["skills"] == load_test.CRITERIA["skills"]
+    scores = json.loads(fake_model.generate_content("skills_score\nSkills: Python\n").text)
+    assert all(1 <= score <= 5 for score in scores.values())
+    empty = json.loads(fake_model.generate_content("skills_score\nSkills: \n").text)
+    assert sum(empty.values()) == 0
+
+
+def test_fake_model_counts_injected_failures(fake_model, monkeypatch):
+    monkeypatch.setattr(load_test.FakeGenerativeModel, "error_rate", 1.0)
+    counts = {"calls": 0, "failures": 0}
+    token = load_test.LLM_COUNTS.set(counts)
+    try:
+        with pytest.raises(RuntimeError):
+            fake_model.generate_content("Job Description:")
+        with pytest.raises(RuntimeError):
+            asyncio.run(fake_model.generate_content_async("Job Description:"))
+    finally:
+        load_test.LLM_COUNTS.reset(token)
+    assert counts == {"calls": 2, "failures": 2}
+
+
+# **Test Documents**
+def test_make_pdf_round_trip():
+    fitz = pytest.importorskip("fitz")
+    lines = load_test.make_document_lines("resume", 60)
+    doc = fitz.open(stream=load_test.make_pdf(lines), filetype="pdf")
+    assert doc.page_count == 2
+    text = "\n".join(page.get_text("text") for page in doc)
+    assert lines[0] in text
+    assert "Skilled in" in text
+
+
+def test_make_pdf_escapes_parentheses():
+    fitz = pytest.importorskip("fitz")
+    doc = fitz.open(stream=load_test.make_pdf(["Python (3.11) \\ FastAPI"]), filetype="pdf")
+    assert "Python (3.11) \\ FastAPI" in doc[0].get_text("text")
+
+
+def test_make_docx_round_trip():
+    docx = pytest.importorskip("docx")
+    lines = load_test.make_document_lines("jd", 10) + ["R&D <team>"]
+    doc = docx.Document(io.BytesIO(load_test.make_docx(lines)))
+    assert [para.text for para in doc.paragraphs] == lines